@@ -7,6 +7,7 @@ path's open() calls work on transcripts fetched from the MCP server.
 from __future__ import annotations
 
 import os
+import uuid
 from pathlib import Path
 
 
@@ -57,11 +58,24 @@ class TranscriptCache:
 
     def put(self, slug: str, content: str) -> None:
         """Cache a transcript to memory and disk."""
-        self._memory[slug] = content
-
         path = self._transcript_path(slug)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content, encoding="utf-8")
+        # Atomic write: a crash mid-write must not leave a truncated
+        # transcript that later reads would treat as a cache hit.  Mode 0o666
+        # lets the kernel apply the current umask, as write_text would.
+        tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        self._memory[slug] = content
 
     def _transcript_path(self, slug: str) -> Path:
         """Return the disk path for a cached transcript."""
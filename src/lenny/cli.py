@@ -22,7 +22,6 @@ from lenny.progress import ProgressDisplay
 from lenny.style import (
     DEFAULT_THEME,
     GOODBYE_TEXT,
-    HELP_TEXT,
     PROGRESS_LABELS,
     THEMES,
     LennyTheme,
@@ -31,6 +30,7 @@ from lenny.style import (
     format_cost_compact,
     format_route_badge,
     format_save_confirmation,
+    render_help,
 )
 
 _initial_theme = THEMES[DEFAULT_THEME]
@@ -212,7 +212,7 @@ def main():
                 console.print(f"[faint]{GOODBYE_TEXT}[/faint]")
                 break
             elif cmd == "/help":
-                console.print(HELP_TEXT)
+                console.print(render_help())
                 continue
             elif cmd == "/episodes":
                 _show_episodes(index)
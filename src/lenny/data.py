@@ -16,8 +16,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_FRONTMATTER_RE = re.compile(r"^---\n.*?\n---\n", re.DOTALL)
 
-@dataclass
+
+@dataclass(slots=True)
 class Episode:
     slug: str
     guest: str
@@ -132,7 +134,7 @@ class TranscriptIndex:
         if self._cache is not None:
             cached = self._cache.get(slug)
             if cached is not None:
-                return _strip_frontmatter(cached)
+                return strip_frontmatter(cached)
 
         # 2. Try MCP server
         if self._mcp_client is not None and episode.filename:
@@ -143,7 +145,7 @@ class TranscriptIndex:
                     self._cache.put(slug, content)
                 # Backfill youtube_url and other metadata from frontmatter
                 self._backfill_metadata(episode, content)
-                return _strip_frontmatter(content)
+                return strip_frontmatter(content)
             except Exception as e:
                 logger.debug("MCP read_content failed for %s: %s", slug, e)
 
@@ -151,7 +153,7 @@ class TranscriptIndex:
         if episode.file_path and os.path.isfile(episode.file_path):
             with open(episode.file_path, "r", encoding="utf-8") as f:
                 content = f.read()
-            return _strip_frontmatter(content)
+            return strip_frontmatter(content)
 
         return None
 
@@ -191,9 +193,9 @@ class TranscriptIndex:
         }
 
 
-def _strip_frontmatter(content: str) -> str:
+def strip_frontmatter(content: str) -> str:
     """Strip YAML frontmatter from markdown content, return body only."""
-    match = re.match(r"^---\n.*?\n---\n", content, re.DOTALL)
+    match = _FRONTMATTER_RE.match(content)
     if match:
         content = content[match.end():]
     return content.strip()
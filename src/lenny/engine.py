@@ -19,7 +19,7 @@ from rlm.core.comms_utils import LMRequest, LMResponse
 from rlm.core.types import RLMChatCompletion, UsageSummary
 
 from lenny.costs import QueryCost, SessionCosts
-from lenny.data import TranscriptIndex
+from lenny.data import TranscriptIndex, strip_frontmatter
 
 
 def _find_project_root() -> Path:
@@ -770,7 +770,7 @@ class LennyEngine:
             if cache is not None:
                 cached = cache.get(slug)
                 if cached is not None:
-                    return _strip_frontmatter(cached)
+                    return strip_frontmatter(cached)
 
             # Determine the MCP filename
             episode = index.episodes.get(slug)
@@ -794,7 +794,7 @@ class LennyEngine:
             if episode is not None:
                 index._backfill_metadata(episode, content)
 
-            return _strip_frontmatter(content)
+            return strip_frontmatter(content)
 
         def read_excerpt(
             slug: str, query: str = "", radius: int = 280,
@@ -826,14 +826,6 @@ class LennyEngine:
                         continue
                     return {"error": f"Excerpt retrieval failed: {e}"}
 
-        def _strip_frontmatter(content: str) -> str:
-            """Strip YAML frontmatter from markdown content."""
-            import re as _re
-            match = _re.match(r"^---\n.*?\n---\n", content, _re.DOTALL)
-            if match:
-                content = content[match.end():]
-            return content.strip()
-
         _MCP_HELPERS.update({
             "search_transcripts": search_transcripts,
             "fetch_transcript": fetch_transcript,
@@ -6,10 +6,12 @@ read_excerpt) via JSON-RPC over Streamable HTTP transport.
 
 from __future__ import annotations
 
+import copy
 import json
 import os
 import urllib.request
 import urllib.error
+from collections import OrderedDict
 from typing import Any
 
 MCP_ENDPOINT = "https://mcp.lennysdata.com/mcp"
@@ -19,6 +21,9 @@ MCP_PROTOCOL_VERSION = "2024-11-05"
 _TIMEOUT_DEFAULT = 10
 _TIMEOUT_READ_CONTENT = 30
 
+# Max distinct search_content queries remembered per client (LRU)
+_SEARCH_CACHE_SIZE = 64
+
 
 class MCPError(Exception):
     """Raised when an MCP server call fails."""
@@ -36,6 +41,7 @@ class MCPClient:
         self.endpoint = endpoint
         self._session_id: str | None = None
         self._request_id = 0
+        self._search_cache: OrderedDict[tuple[str, str, int], dict] = OrderedDict()
 
     # ------------------------------------------------------------------
     # Public API — mirrors the four MCP tools
@@ -58,12 +64,26 @@ class MCPClient:
         query: str,
         content_type: str = "",
         limit: int = 20,
-    ) -> dict:
-        """Search across the archive for topics or keywords."""
-        return self._call_tool(
+    ) -> Any:
+        """Search across the archive for topics or keywords.
+
+        Clean dict results are LRU-cached per query; callers get copies.
+        """
+        key = (query, content_type, limit)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            self._search_cache.move_to_end(key)
+            return copy.deepcopy(cached)
+
+        result = self._call_tool(
             "search_content",
             {"query": query, "content_type": content_type, "limit": limit},
         )
+        if isinstance(result, dict) and not result.get("isError"):
+            self._search_cache[key] = copy.deepcopy(result)
+            if len(self._search_cache) > _SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        return result
 
     def read_content(self, filename: str) -> str:
         """Read the full markdown content of a specific post or transcript."""
@@ -13,6 +13,7 @@ from __future__ import annotations
 import logging
 import re
 import time
+from collections import deque
 
 from rich.console import Console, Group, RenderableType
 from rich.live import Live
@@ -32,19 +33,28 @@ from lenny.style import (
     PROGRESS_LABELS,
     SUCCESS_COLOR,
     LennyTheme,
+    analyzing_excerpts_label,
 )
 
 
-# Lines to skip when extracting status from REPL stdout
-_NOISE_PATTERNS = [
-    re.compile(r"^\s*$"),              # blank lines
-    re.compile(r"^Traceback", re.I),   # error traces
-    re.compile(r"^\s*File \""),        # traceback file lines
-    re.compile(r"^\{"),                # JSON / dict dumps
-    re.compile(r"^\["),                # list dumps
-    re.compile(r"^<"),                 # repr output
-    re.compile(r"^-+$"),              # horizontal rules
-]
+# Lines to skip when extracting status from REPL stdout, keyed by first
+# character so most lines are classified with a single set lookup:
+# JSON / dict dumps, list dumps, and repr output.
+_NOISE_FIRST_CHARS = frozenset("{[<")
+
+# FINAL() / FINAL_VAR() call at the start of a line in the LLM response
+_FINAL_CALL_RE = re.compile(r"^\s*FINAL(?:_VAR)?\(", re.MULTILINE)
+
+# Every token _infer_from_code looks for, matched in a single scan.
+# llm_query_batched must precede llm_query so the longer name wins.
+_CODE_HINT_RE = re.compile(
+    r"open\(|transcript|llm_query_batched|llm_query|re\.search|re\.findall"
+    r"|context\[|catalog",
+    re.IGNORECASE,
+)
+
+# Marker appended to truncated status text
+_ELLIPSIS = "\u2026"
 
 # How many completed steps to keep visible
 _MAX_COMPLETED = 4
@@ -64,6 +74,16 @@ class ProgressDisplay:
             engine.rlm.logger = None
     """
 
+    __slots__ = (
+        "console",
+        "_theme",
+        "_iteration_count",
+        "_start_time",
+        "_completed_steps",
+        "_current_status",
+        "_live",
+    )
+
     def __init__(
         self,
         console: Console,
@@ -75,7 +95,7 @@ class ProgressDisplay:
         self._theme = theme
         self._iteration_count = 0
         self._start_time: float | None = None
-        self._completed_steps: list[str] = []
+        self._completed_steps: deque[str] = deque(maxlen=_MAX_COMPLETED)
         self._current_status: str = initial_status
         self._live: Live | None = None
 
@@ -84,9 +104,9 @@ class ProgressDisplay:
     # ------------------------------------------------------------------
 
     def __enter__(self) -> ProgressDisplay:
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
         self._iteration_count = 0
-        self._completed_steps = []
+        self._completed_steps.clear()
         self._live = Live(
             self._build_renderable(),
             console=self.console,
@@ -121,10 +141,8 @@ class ProgressDisplay:
         if self._current_status and self._current_status != new_status:
             # Strip trailing "..." for the completed form
             done_text = self._current_status.rstrip(".")
+            # Bounded deque: the oldest step drops off once it is full
             self._completed_steps.append(done_text)
-            # Cap internal list to avoid unbounded growth
-            if len(self._completed_steps) > _MAX_COMPLETED * 2:
-                self._completed_steps = self._completed_steps[-_MAX_COMPLETED:]
 
         self._current_status = new_status
 
@@ -140,7 +158,7 @@ class ProgressDisplay:
     def clear_iterations(self) -> None:
         """Reset iteration state (called by some RLM library versions)."""
         self._iteration_count = 0
-        self._completed_steps = []
+        self._completed_steps.clear()
 
     @property
     def iteration_count(self) -> int:
@@ -168,9 +186,7 @@ class ProgressDisplay:
             return PROGRESS_LABELS["preparing_answer"]
 
         # Check for FINAL() / FINAL_VAR() call in the LLM response
-        if iteration.response and re.search(
-            r"^\s*FINAL(?:_VAR)?\(", iteration.response, re.MULTILINE,
-        ):
+        if iteration.response and _FINAL_CALL_RE.search(iteration.response):
             return PROGRESS_LABELS["preparing_answer"]
 
         # Try to get a meaningful line from stdout
@@ -178,38 +194,32 @@ class ProgressDisplay:
         if stdout_line:
             return _truncate(stdout_line, 70)
 
-        # Infer from sub-LLM calls
+        # Infer from sub-LLM calls, else from code patterns — one pass over
+        # the blocks; any block with sub-LLM calls outranks a code hint
+        hint = None
         for cb in iteration.code_blocks:
             if cb.result.rlm_calls:
-                n = len(cb.result.rlm_calls)
-                return PROGRESS_LABELS["analyzing_excerpts"].format(
-                    n=n, s="s" if n != 1 else "",
-                )
-
-        # Infer from code patterns
-        for cb in iteration.code_blocks:
-            hint = _infer_from_code(cb.code)
-            if hint:
-                return hint
+                return analyzing_excerpts_label(len(cb.result.rlm_calls))
+            if hint is None:
+                hint = _infer_from_code(cb.code)
 
         # Fallback
-        return PROGRESS_LABELS["thinking"]
+        return hint or PROGRESS_LABELS["thinking"]
 
     def _best_stdout_line(self, iteration: RLMIteration) -> str | None:
         """Return the most informative stdout line from the iteration."""
-        candidates: list[str] = []
-        for cb in iteration.code_blocks:
+        # Scan from the end: the last meaningful line is the most recent output
+        for cb in reversed(iteration.code_blocks):
             if not cb.result.stdout:
                 continue
-            for line in cb.result.stdout.strip().split("\n"):
+            for line in reversed(cb.result.stdout.strip().split("\n")):
                 clean = line.strip()
                 if len(clean) < 5 or len(clean) > 120:
                     continue
-                if any(p.match(clean) for p in _NOISE_PATTERNS):
+                if _is_noise(clean):
                     continue
-                candidates.append(clean)
-        # Take the last meaningful line (most recent output)
-        return candidates[-1] if candidates else None
+                return clean
+        return None
 
     # ------------------------------------------------------------------
     # Rendering
@@ -220,7 +230,7 @@ class ProgressDisplay:
         parts: list[RenderableType] = []
 
         # Completed steps (checkmark + muted text)
-        for step in self._completed_steps[-_MAX_COMPLETED:]:
+        for step in self._completed_steps:
             line = Text("  ")
             line.append("\u2713 ", style=Style(color=SUCCESS_COLOR))
             line.append(step, style=Style(color=CREAM_DIM))
@@ -245,8 +255,8 @@ class ProgressDisplay:
         """Format elapsed time as M:SS."""
         if self._start_time is None:
             return "0:00"
-        secs = int(time.time() - self._start_time)
-        return f"{secs // 60}:{secs % 60:02d}"
+        mins, secs = divmod(int(time.monotonic() - self._start_time), 60)
+        return f"{mins}:{secs:02d}"
 
 
 # ------------------------------------------------------------------
@@ -255,22 +265,34 @@ class ProgressDisplay:
 
 
 def _truncate(text: str, max_len: int) -> str:
-    if len(text) <= max_len:
-        return text
-    return text[: max_len - 1] + "\u2026"
+    return text if len(text) <= max_len else text[: max_len - 1] + _ELLIPSIS
+
+
+def _is_noise(line: str) -> bool:
+    """Return True for a stripped, non-empty stdout line that carries no status."""
+    first = line[0]
+    if first in _NOISE_FIRST_CHARS:
+        return True
+    if first == "-":
+        return not line.strip("-")                   # horizontal rules
+    if first in "Tt":
+        return line[:9].lower() == "traceback"       # error traces
+    if first == "F":
+        return line.startswith('File "')             # traceback file lines
+    return False
 
 
 def _infer_from_code(code: str) -> str | None:
     """Infer a human-readable status from REPL code when stdout is empty."""
-    low = code.lower()
-    if "open(" in low and "transcript" in low:
+    found = {m.lower() for m in _CODE_HINT_RE.findall(code)}
+    if "open(" in found and "transcript" in found:
         return PROGRESS_LABELS["reading_transcripts"]
-    if "llm_query_batched" in low:
+    if "llm_query_batched" in found:
         return PROGRESS_LABELS["analyzing_parallel"]
-    if "llm_query" in low:
+    if "llm_query" in found:
         return PROGRESS_LABELS["analyzing_ai"]
-    if "re.search" in low or "re.findall" in low:
+    if "re.search" in found or "re.findall" in found:
         return PROGRESS_LABELS["searching_text"]
-    if "context[" in low and "catalog" in low:
+    if "context[" in found and "catalog" in found:
         return PROGRESS_LABELS["scanning_catalog"]
     return None
@@ -7,11 +7,15 @@ or progress.py should hard-code a color or style string.
 
 from __future__ import annotations
 
+import functools
 import os
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import date
+from types import MappingProxyType
 
 from rich.console import Console
+from rich.highlighter import ReprHighlighter
 from rich.style import Style
 from rich.text import Text
 from rich.theme import Theme
@@ -45,11 +49,23 @@ ERROR_COLOR    = "#D45B5B"
 WARNING_COLOR  = "#D4A94A"
 
 
+# -------------------------------------------------------------------
+# Shared styles — Rich ``Style`` is immutable, so build each one once
+# -------------------------------------------------------------------
+
+_STYLE_AMBER_BOLD = Style(color=AMBER, bold=True)
+_STYLE_CREAM      = Style(color=CREAM)
+_STYLE_CREAM_DIM  = Style(color=CREAM_DIM)
+_STYLE_GRAY_MUTED = Style(color=GRAY_MUTED)
+_STYLE_GRAY_DARK  = Style(color=GRAY_DARK)
+_STYLE_SUCCESS    = Style(color=SUCCESS_COLOR)
+
+
 # -------------------------------------------------------------------
 # Theme definitions
 # -------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True)
 class LennyTheme:
     """Bundled theme settings — Rich styles + behavioural flags."""
 
@@ -75,7 +91,17 @@ class LennyTheme:
     spinner_style: str = "dots"
 
     def to_rich_theme(self) -> Theme:
-        """Convert to a ``rich.theme.Theme`` for ``Console(theme=...)``."""
+        """Convert to a ``rich.theme.Theme`` for ``Console(theme=...)``.
+
+        Built once per theme and reused on later calls.
+        """
+        return self._rich_theme
+
+    # Derived values are cached on first use; the dataclass is frozen, so
+    # they can never go stale.
+
+    @functools.cached_property
+    def _rich_theme(self) -> Theme:
         return Theme({
             "accent":           self.accent,
             "body":             self.text,
@@ -91,6 +117,29 @@ class LennyTheme:
             "border.research":  self.border_research,
         })
 
+    @functools.cached_property
+    def _body_bold_style(self) -> Style:
+        """Bold body-text style for the route badge."""
+        return Style(color=self.text, bold=True)
+
+    @functools.cached_property
+    def _panel_params(self) -> dict[str, Mapping[str, object]]:
+        """Read-only ``Panel()`` kwargs per answer mode."""
+        return {
+            mode: MappingProxyType({
+                "title": (
+                    f"[{self.accent}]Lenny[/{self.accent}] "
+                    f"[{self.text_faint}]{mode}[/{self.text_faint}]"
+                ),
+                "border_style": border,
+                "padding": (1, 2),
+            })
+            for mode, border in (
+                ("fast", self.border_fast),
+                ("research", self.border_research),
+            )
+        }
+
 
 THEME_WARM = LennyTheme(
     name="warm",
@@ -170,85 +219,85 @@ def is_wide_terminal(console: Console, threshold: int = 80) -> bool:
 # Brand mark — campfire (flame teardrop + crossed logs)
 # -------------------------------------------------------------------
 
-# Full mark (~100 chars wide).  Requires width >= 100 to display.
-_BRAND_MARK_FLAME = [
-    "                                           @@@@@@@@",
-    "                                            @@@@@@@@@%+",
-    "                                              @@@@@@@@@*+:",
-    "                                              @@@@@=+*@@%*==",
-    "                                               @@@@@===%@%#==",
-    "                                   @@@          @@@@====#@%+==",
-    "                                 @@@@@          @@@@====+%@%===",
-    "                                @@@@@#===       @@@@=====#@@===",
-    "                               @@@@@@#===       @@@@===-=#@@===",
-    "                               @@@@%@%*===     @@@@*===-*%@#===",
-    "                              @@@@ =*%@#+++ @@@@@@======#@%+=-",
-    "                              @@@@===+*@@@@@@@%#=======*%%#-=",
-    "                              @@@ -=====+++++=========+@@*=--",
-    "                              @@@ ===================+@@*=-",
-    "                              @@@@ =================+#@%+-=   @@@@@=-",
-    "                               @@@@ ================*@@+==    @@@@@#+--",
-    "                                @@@@*===============#@@===    @@@@@@%*=--",
-    "                                 @@@@%==============*@@===    @@@@-+*@%+==",
-]
-_BRAND_MARK_LOGS = [
-    "                      @@@@@@@@#+=  @@@@-============+#@#++*@@@@@@+===*@%*==",
-    "                       @@@@@@@@*==  @@@@+=============*@@@@@@@#+=====-*%%*-=",
-    "                        @@@@-=%@*-== @@@@================+++===-=======#@%===",
-    "                        @@@@--+%#==+ @@@@======+*@%#+==================+#@#=-=",
-    "                        @@@@=--#%*-=+@@@ ======--#@@@%#=================*@@===",
-    "                        @@@@===+#%##%%#=========-=@@##@%#+==============*%@+==",
-    "                       @@@@@=======+============--#@*-=%@%*-============+#@*==",
-    "                       @@@@@============+##+-====-+%#=:-+%@#============+#@#==+",
-    "                       @@@@---=======--*@@#+=====-=%%+:-=+#@#+==========+#@#+=+",
-    "                      @@@@@=========-=*@*%%+-====-=%#=----+%@*==========+#@*==*",
-    "                      @@@@@========-=#%*-*%#=====:*@*-----=+%%+========-+%@*==",
-    "                      @@@@@=======--*%#--=*%#*+++*%#=:-----=%@*=========*@@===",
-    "                      @@@@@=======-=##+----=+#%%%*=--------=%@*-========#@%===",
-    "                      @@@@@=======-+%#=--------------------=%@*========*%%+==",
-    "                       @@@@=======-=%#+:-------------------=@%*=======+%%#-==",
-    "                       @@@@@======--#%*:------------------=#@*========%@*=== @@@@@",
-    "                         @@@%======-+%%+-----------------=#@#+======+%@*=-+@@@@@@@@",
-    "                          @@@ -=====-+%@#-:-------------+%@%=======*%@+=-@@@@ %@@@",
-    "                         @@@@@@*-======*@@#*+=-----==+*%@#*======+%%#+-*@@@==#%%++",
-    "                   @@@@@@@@@@@@@@--======*%@@@@@@@@@@@@*=======+%@#+=    ==+%@@#*",
-    "            @@@@@@@@@@@@%+===-=*%@@%+========+******+=======+#%%#+==========+#@@@@@@@@@",
-    "           @@@@@@@@@@%+==========++#@@%%*+===--====-===+*#%%%*+==============+@@@@@@@@@@@",
-    "          @@@%=---=+%@%*===========-=++##%%%%%%%%%%%%%%%#*+=================*%@#+=--=-@@@@",
-    "          @@#--+++===#@%+==================================================*%%*===+*+-=#@@@",
-    "         @@%+-=@*=====#@%=====+*#%@@#+========================*#@@%#*+=====@@*====+#%=-*@@@",
-    "         @@%+=+@*=*%+=*@@==*#%#**++=+**###+==============*###*+++++**#%#+=+@%+=+%++#@+=*@@@",
-    "          @@*-=@#+=@#=+%@==---=+#%@@@@%#+====+#%@@@@#*+====+#%@@@@%*+=--==+@#+=%%=*@@==#@@@",
-    "          @@#+-*%@%@*=*@%==*#%%%#**+==++*#%@@%#**++**#%@%##*+===+**#%%%#+==@%+=*@@@%+-+%@@",
-    "           @@#-===+===#%+===--:--=*%@@@@@#+=--==+  ==---=*#@@@@@#+=-:--====*%*===+====%@@",
-    "           *%%%+====-+++==+**#%@@%#**++==--=+          =---==+**##%@%%#**++=++======*%%%*",
-    "            =+%@@#*+**%@@@@@%*+==-====                        =======+#%@@@@%#*+**%@@#+-",
-    "             -=+*#######*+=----=+                                  ==---==+*####%##*=--",
-    "               -========--=                                             ==-=========-",
-]
+# Full mark (~90 chars wide).  Only shown when the terminal is at least
+# _BRAND_MARK_WIDTH columns, so Rich never soft-wraps the art.
+_BRAND_MARK_FLAME = """\
+                                           @@@@@@@@
+                                            @@@@@@@@@%+
+                                              @@@@@@@@@*+:
+                                              @@@@@=+*@@%*==
+                                               @@@@@===%@%#==
+                                   @@@          @@@@====#@%+==
+                                 @@@@@          @@@@====+%@%===
+                                @@@@@#===       @@@@=====#@@===
+                               @@@@@@#===       @@@@===-=#@@===
+                               @@@@%@%*===     @@@@*===-*%@#===
+                              @@@@ =*%@#+++ @@@@@@======#@%+=-
+                              @@@@===+*@@@@@@@%#=======*%%#-=
+                              @@@ -=====+++++=========+@@*=--
+                              @@@ ===================+@@*=-
+                              @@@@ =================+#@%+-=   @@@@@=-
+                               @@@@ ================*@@+==    @@@@@#+--
+                                @@@@*===============#@@===    @@@@@@%*=--
+                                 @@@@%==============*@@===    @@@@-+*@%+==
+"""
+_BRAND_MARK_LOGS = """\
+                      @@@@@@@@#+=  @@@@-============+#@#++*@@@@@@+===*@%*==
+                       @@@@@@@@*==  @@@@+=============*@@@@@@@#+=====-*%%*-=
+                        @@@@-=%@*-== @@@@================+++===-=======#@%===
+                        @@@@--+%#==+ @@@@======+*@%#+==================+#@#=-=
+                        @@@@=--#%*-=+@@@ ======--#@@@%#=================*@@===
+                        @@@@===+#%##%%#=========-=@@##@%#+==============*%@+==
+                       @@@@@=======+============--#@*-=%@%*-============+#@*==
+                       @@@@@============+##+-====-+%#=:-+%@#============+#@#==+
+                       @@@@---=======--*@@#+=====-=%%+:-=+#@#+==========+#@#+=+
+                      @@@@@=========-=*@*%%+-====-=%#=----+%@*==========+#@*==*
+                      @@@@@========-=#%*-*%#=====:*@*-----=+%%+========-+%@*==
+                      @@@@@=======--*%#--=*%#*+++*%#=:-----=%@*=========*@@===
+                      @@@@@=======-=##+----=+#%%%*=--------=%@*-========#@%===
+                      @@@@@=======-+%#=--------------------=%@*========*%%+==
+                       @@@@=======-=%#+:-------------------=@%*=======+%%#-==
+                       @@@@@======--#%*:------------------=#@*========%@*=== @@@@@
+                         @@@%======-+%%+-----------------=#@#+======+%@*=-+@@@@@@@@
+                          @@@ -=====-+%@#-:-------------+%@%=======*%@+=-@@@@ %@@@
+                         @@@@@@*-======*@@#*+=-----==+*%@#*======+%%#+-*@@@==#%%++
+                   @@@@@@@@@@@@@@--======*%@@@@@@@@@@@@*=======+%@#+=    ==+%@@#*
+            @@@@@@@@@@@@%+===-=*%@@%+========+******+=======+#%%#+==========+#@@@@@@@@@
+           @@@@@@@@@@%+==========++#@@%%*+===--====-===+*#%%%*+==============+@@@@@@@@@@@
+          @@@%=---=+%@%*===========-=++##%%%%%%%%%%%%%%%#*+=================*%@#+=--=-@@@@
+          @@#--+++===#@%+==================================================*%%*===+*+-=#@@@
+         @@%+-=@*=====#@%=====+*#%@@#+========================*#@@%#*+=====@@*====+#%=-*@@@
+         @@%+=+@*=*%+=*@@==*#%#**++=+**###+==============*###*+++++**#%#+=+@%+=+%++#@+=*@@@
+          @@*-=@#+=@#=+%@==---=+#%@@@@%#+====+#%@@@@#*+====+#%@@@@%*+=--==+@#+=%%=*@@==#@@@
+          @@#+-*%@%@*=*@%==*#%%%#**+==++*#%@@%#**++**#%@%##*+===+**#%%%#+==@%+=*@@@%+-+%@@
+           @@#-===+===#%+===--:--=*%@@@@@#+=--==+  ==---=*#@@@@@#+=-:--====*%*===+====%@@
+           *%%%+====-+++==+**#%@@%#**++==--=+          =---==+**##%@%%#**++=++======*%%%*
+            =+%@@#*+**%@@@@@%*+==-====                        =======+#%@@@@%#*+**%@@#+-
+             -=+*#######*+=----=+                                  ==---==+*####%##*=--
+               -========--=                                             ==-=========-
+"""
+
+
+_BRAND_MARK_WIDTH = max(
+    len(line) for line in (_BRAND_MARK_FLAME + _BRAND_MARK_LOGS).splitlines()
+)
 
 
 def build_splash_art(theme: LennyTheme, console: Console) -> Text | None:
     """Build the styled brand mark, or *None* if too narrow / minimal theme.
 
     Returns a ``rich.text.Text`` object with amber flame and gray logs.
-    The art is ~100 chars wide, so the terminal must be at least 100 columns.
+    The terminal must be at least as wide as the widest line of the art.
     """
     if not theme.show_splash_art:
         return None
 
-    if console.width < 100:
+    if console.width < _BRAND_MARK_WIDTH:
         return None
 
-    flame_style = Style(color=AMBER)
-    log_style = Style(color=LOG_BROWN)
-
     text = Text()
-    for line in _BRAND_MARK_FLAME:
-        text.append(line + "\n", style=flame_style)
-    for line in _BRAND_MARK_LOGS:
-        text.append(line + "\n", style=log_style)
-
+    text.append(_BRAND_MARK_FLAME, style=Style(color=AMBER))
+    text.append(_BRAND_MARK_LOGS, style=Style(color=LOG_BROWN))
     return text
 
 
@@ -256,7 +305,7 @@ def build_splash_art(theme: LennyTheme, console: Console) -> Text | None:
 # Rotating daily prompt examples
 # -------------------------------------------------------------------
 
-_DAILY_PROMPTS = [
+_DAILY_PROMPTS = (
     "What frameworks do guests recommend for prioritization?",
     "What did Brian Chesky say about founder mode?",
     "Which guests disagree on when to hire your first PM?",
@@ -269,7 +318,7 @@ _DAILY_PROMPTS = [
     "How do guests recommend structuring a product team?",
     "What advice do guests give about career transitions into product?",
     "What do guests think makes a great product leader?",
-]
+)
 
 
 def _pick_daily_prompt() -> str:
@@ -304,27 +353,27 @@ def build_splash_card(
         text.append("\n")
 
     # App name + tagline
-    text.append("  Lenny\n", style=Style(color=AMBER, bold=True))
-    text.append("  Podcast transcript explorer\n\n", style=Style(color=CREAM_DIM))
+    text.append("  Lenny\n", style=_STYLE_AMBER_BOLD)
+    text.append("  Podcast transcript explorer\n\n", style=_STYLE_CREAM_DIM)
 
     # Status line
-    text.append(f"  {episode_count} episodes available", style=Style(color=CREAM))
-    text.append("  \u00b7  ", style=Style(color=GRAY_DARK))
-    text.append(f"mode: {active_mode}", style=Style(color=CREAM_DIM))
+    text.append(f"  {episode_count} episodes available", style=_STYLE_CREAM)
+    text.append("  \u00b7  ", style=_STYLE_GRAY_DARK)
+    text.append(f"mode: {active_mode}", style=_STYLE_CREAM_DIM)
     if auth_label:
-        text.append("  \u00b7  ", style=Style(color=GRAY_DARK))
-        text.append(auth_label, style=Style(color=CREAM_DIM))
-    text.append("\n", style=Style())
+        text.append("  \u00b7  ", style=_STYLE_GRAY_DARK)
+        text.append(auth_label, style=_STYLE_CREAM_DIM)
+    text.append("\n")
 
     # Daily prompt example (warm theme only)
     if theme.show_daily_prompt:
         prompt_example = _pick_daily_prompt()
-        text.append(f'\n  Try: "{prompt_example}"\n', style=Style(color=GRAY_MUTED))
+        text.append(f'\n  Try: "{prompt_example}"\n', style=_STYLE_GRAY_MUTED)
 
     # Command bar
     text.append(
         "\n  /help  /episodes  /cost  /mode  /auth  /theme  /quit\n",
-        style=Style(color=GRAY_DARK),
+        style=_STYLE_GRAY_DARK,
     )
 
     return text
@@ -345,37 +394,31 @@ def format_route_badge(mode: str, reason: str, theme: LennyTheme) -> Text:
         FAST  specific guest lookup
         RESEARCH  cross-episode synthesis
     """
-    text = Text("  ")
-    if mode == "fast":
-        text.append("FAST", style=Style(color=theme.text, bold=True))
-    else:
-        text.append("RESEARCH", style=Style(color=theme.text, bold=True))
-    text.append(f"  {reason}", style=Style(color=GRAY_MUTED))
-    return text
+    label = "FAST" if mode == "fast" else "RESEARCH"
+    return Text.assemble(
+        "  ",
+        (label, theme._body_bold_style),
+        (f"  {reason}", _STYLE_GRAY_MUTED),
+    )
 
 
 # -------------------------------------------------------------------
 # Answer panel formatting
 # -------------------------------------------------------------------
 
-def answer_panel_params(mode: str, theme: LennyTheme) -> dict:
+def answer_panel_params(mode: str, theme: LennyTheme) -> Mapping[str, object]:
     """Return ``**kwargs`` for ``Panel()`` to render an answer card.
 
+    The mapping is prebuilt per theme and read-only — unpack it, don't
+    mutate it.
+
     Usage::
 
         console.print(Panel(content, **answer_panel_params("fast", theme)))
     """
     if mode == "fast":
-        return {
-            "title": f"[{theme.accent}]Lenny[/{theme.accent}] [{theme.text_faint}]fast[/{theme.text_faint}]",
-            "border_style": theme.border_fast,
-            "padding": (1, 2),
-        }
-    return {
-        "title": f"[{theme.accent}]Lenny[/{theme.accent}] [{theme.text_faint}]research[/{theme.text_faint}]",
-        "border_style": theme.border_research,
-        "padding": (1, 2),
-    }
+        return theme._panel_params["fast"]
+    return theme._panel_params["research"]
 
 
 # -------------------------------------------------------------------
@@ -384,7 +427,7 @@ def answer_panel_params(mode: str, theme: LennyTheme) -> dict:
 
 def format_cost_compact(cost_str: str) -> Text:
     """Wrap the cost string in muted styling for inline display."""
-    return Text(cost_str, style=Style(color=GRAY_MUTED))
+    return Text(cost_str, style=_STYLE_GRAY_MUTED)
 
 
 # -------------------------------------------------------------------
@@ -394,8 +437,8 @@ def format_cost_compact(cost_str: str) -> Text:
 def format_save_confirmation(filename: str) -> Text:
     """Render the save confirmation line."""
     text = Text("  ")
-    text.append("\u2713", style=Style(color=SUCCESS_COLOR))
-    text.append(f" Saved: {filename}", style=Style(color=GRAY_MUTED))
+    text.append("\u2713", style=_STYLE_SUCCESS)
+    text.append(f" Saved: {filename}", style=_STYLE_GRAY_MUTED)
     return text
 
 
@@ -427,6 +470,20 @@ HELP_TEXT = """\
 """
 
 
+@functools.lru_cache(maxsize=1)
+def render_help() -> Text:
+    """Return ``HELP_TEXT`` parsed into a ``Text``, once per process.
+
+    The ``[accent]`` / ``[faint]`` tags stay as theme style names and are
+    resolved by the console at print time, so the cached result stays
+    correct across ``/theme`` switches.  Repr highlighting is applied to
+    match what ``console.print(HELP_TEXT)`` renders.
+    """
+    text = Text.from_markup(HELP_TEXT)
+    ReprHighlighter().highlight(text)
+    return text
+
+
 # -------------------------------------------------------------------
 # Goodbye
 # -------------------------------------------------------------------
@@ -463,3 +520,14 @@ PROGRESS_LABELS: dict[str, str] = {
     # Rate limit
     "rate_limited":          "Rate limited \u2014 retrying in {wait}s...",
 }
+
+# Prebuilt singular / plural forms of "analyzing_excerpts"
+_ANALYZING_EXCERPTS_ONE = PROGRESS_LABELS["analyzing_excerpts"].format(n=1, s="")
+_ANALYZING_EXCERPTS_MANY = PROGRESS_LABELS["analyzing_excerpts"].format(n="{}", s="s")
+
+
+def analyzing_excerpts_label(n: int) -> str:
+    """Return the "Analyzing N excerpt(s)..." status for *n* sub-LLM calls."""
+    if n == 1:
+        return _ANALYZING_EXCERPTS_ONE
+    return _ANALYZING_EXCERPTS_MANY.format(n)
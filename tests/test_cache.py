@@ -0,0 +1,51 @@
+"""Tests for lenny.cache — atomic transcript writes."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from lenny.cache import TranscriptCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return TranscriptCache(tmp_path)
+
+
+# ---------------------------------------------------------------------------
+# put
+# ---------------------------------------------------------------------------
+
+class TestPut:
+
+    def test_writes_transcript_without_leftover_temp_files(self, cache, tmp_path):
+        cache.put("brian-chesky", "first")
+        cache.put("brian-chesky", "second")
+        assert (tmp_path / "brian-chesky" / "transcript.md").read_text() == "second"
+        assert list(tmp_path.rglob("*.tmp")) == []
+
+    def test_file_mode_follows_umask(self, cache, tmp_path):
+        previous = os.umask(0o027)
+        try:
+            cache.put("brian-chesky", "text")
+        finally:
+            os.umask(previous)
+        mode = (tmp_path / "brian-chesky" / "transcript.md").stat().st_mode & 0o777
+        assert mode == 0o640
+
+    def test_failed_write_keeps_existing_entry(self, cache, tmp_path, monkeypatch):
+        cache.put("brian-chesky", "original")
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", fail_replace)
+        with pytest.raises(OSError, match="disk full"):
+            cache.put("brian-chesky", "partial")
+
+        assert (tmp_path / "brian-chesky" / "transcript.md").read_text() == "original"
+        assert list(tmp_path.rglob("*.tmp")) == []
+        assert cache.get("brian-chesky") == "original"
+        assert TranscriptCache(tmp_path).get("brian-chesky") == "original"
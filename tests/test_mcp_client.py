@@ -0,0 +1,80 @@
+"""Tests for lenny.mcp_client — search_content result caching."""
+
+from __future__ import annotations
+
+import pytest
+
+from lenny.mcp_client import _SEARCH_CACHE_SIZE, MCPClient
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """MCPClient whose tool calls are answered locally and counted."""
+    mcp = MCPClient(token="test")
+    mcp.calls = []
+    mcp.responses = {}
+
+    def fake_call_tool(tool_name, arguments, timeout=None):
+        mcp.calls.append((tool_name, arguments["query"]))
+        return mcp.responses.get(
+            arguments["query"], {"results": [{"title": arguments["query"]}]},
+        )
+
+    monkeypatch.setattr(mcp, "_call_tool", fake_call_tool)
+    return mcp
+
+
+# ---------------------------------------------------------------------------
+# search_content cache
+# ---------------------------------------------------------------------------
+
+class TestSearchCache:
+
+    def test_repeat_query_is_a_cache_hit(self, client):
+        first = client.search_content("pricing")
+        second = client.search_content("pricing")
+        assert first == second
+        assert client.calls == [("search_content", "pricing")]
+
+    def test_key_includes_content_type_and_limit(self, client):
+        client.search_content("pricing")
+        client.search_content("pricing", content_type="podcast")
+        client.search_content("pricing", limit=5)
+        assert len(client.calls) == 3
+
+    def test_evicts_least_recently_used(self, client):
+        for i in range(_SEARCH_CACHE_SIZE):
+            client.search_content(f"q{i}")
+        client.search_content("q0")                     # refresh q0
+        client.search_content("overflow")               # evicts q1
+        assert len(client._search_cache) == _SEARCH_CACHE_SIZE
+
+        client.calls.clear()
+        client.search_content("q0")
+        client.search_content("q1")
+        assert client.calls == [("search_content", "q1")]
+
+    def test_mutating_result_does_not_touch_cache(self, client):
+        first = client.search_content("pricing")
+        first["results"][0]["title"] = "mutated"
+        first["results"].append({"title": "extra"})
+
+        second = client.search_content("pricing")
+        assert second == {"results": [{"title": "pricing"}]}
+        second["results"].clear()
+        assert client.search_content("pricing") == {"results": [{"title": "pricing"}]}
+
+    @pytest.mark.parametrize(
+        "response",
+        [
+            pytest.param("Error: session expired", id="text"),
+            pytest.param({"isError": True, "results": []}, id="is_error"),
+        ],
+    )
+    def test_error_results_are_not_cached(self, client, response):
+        client.responses["pricing"] = response
+        assert client.search_content("pricing") == response
+
+        del client.responses["pricing"]
+        assert client.search_content("pricing") == {"results": [{"title": "pricing"}]}
+        assert len(client.calls) == 2
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import time
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 from rich.live import Live
@@ -18,7 +18,7 @@ from rlm.core.types import (
     UsageSummary,
 )
 
-from lenny.progress import ProgressDisplay, _infer_from_code, _truncate
+from lenny.progress import _MAX_COMPLETED, ProgressDisplay, _infer_from_code, _truncate
 from lenny.style import PROGRESS_LABELS
 
 
@@ -65,6 +65,64 @@ def _make_rlm_call() -> RLMChatCompletion:
     )
 
 
+# ProgressDisplay only counts sub-LLM calls, so one record can stand for many
+_ONE_CALL = _make_rlm_call()
+
+# Expected "Analyzing N excerpts" labels, formatted once from the template
+_EXPECTED_ANALYZE_1 = PROGRESS_LABELS["analyzing_excerpts"].format(n=1, s="")
+_EXPECTED_ANALYZE_2 = PROGRESS_LABELS["analyzing_excerpts"].format(n=2, s="s")
+_EXPECTED_ANALYZE_3 = PROGRESS_LABELS["analyzing_excerpts"].format(n=3, s="s")
+
+
+class _StubConsole:
+    """Console stand-in for tests that never render through Rich Live."""
+
+    __slots__ = ()
+
+    def print(self, *args, **kwargs) -> None:
+        pass
+
+    def __getattr__(self, name: str):
+        return lambda *args, **kwargs: None
+
+
+@pytest.fixture(scope="module")
+def progress() -> ProgressDisplay:
+    """Shared display for tests that only read status, never log()."""
+    return ProgressDisplay(_StubConsole(), initial_status="Searching...")
+
+
+@pytest.fixture
+def fresh_progress() -> ProgressDisplay:
+    """Per-test display for lifecycle tests that mutate state."""
+    p = ProgressDisplay(_StubConsole(), initial_status="Starting...")
+    p._start_time = time.monotonic()
+    return p
+
+
+@pytest.fixture(scope="module")
+def empty_iteration() -> RLMIteration:
+    """Read-only iteration with no code blocks, shared across tests."""
+    return RLMIteration(prompt="test", response="hmm", code_blocks=[])
+
+
+# (code, PROGRESS_LABELS key) pairs; iterations are built once at import
+_CODE_INFERENCE_CASES = [
+    ('with open(f"{transcript_dir}/{slug}/transcript.md") as f:', "reading_transcripts"),
+    ("results = llm_query_batched(prompts)", "analyzing_parallel"),
+    ("answer = llm_query(prompt)", "analyzing_ai"),
+    ("matches = re.search(r'pattern', text)", "searching_text"),
+    ('episodes = context["catalog"]', "scanning_catalog"),
+]
+
+
+# Twenty distinct stdout statuses for exercising the completed-steps cap
+_CAP_ITERATIONS = [
+    _make_iteration(code="x", stdout=f"Status message number {i:02d} here")
+    for i in range(20)
+]
+
+
 # ---------------------------------------------------------------------------
 # _extract_status tests
 # ---------------------------------------------------------------------------
@@ -72,172 +130,123 @@ def _make_rlm_call() -> RLMChatCompletion:
 class TestExtractStatus:
     """Test ProgressDisplay._extract_status under various iteration shapes."""
 
-    def _make_progress(self) -> ProgressDisplay:
-        console = MagicMock()
-        return ProgressDisplay(console, initial_status="Searching...")
-
-    def test_final_answer_set(self):
-        p = self._make_progress()
+    def test_final_answer_set(self, progress):
         it = _make_iteration(final_answer="Here is the answer")
-        assert p._extract_status(it) == PROGRESS_LABELS["preparing_answer"]
+        assert progress._extract_status(it) == PROGRESS_LABELS["preparing_answer"]
 
-    def test_final_call_in_response(self):
+    def test_final_call_in_response(self, progress):
         """FINAL(...) at start of line triggers preparing answer."""
-        p = self._make_progress()
         it = _make_iteration(response="Let me wrap up.\nFINAL(my_answer)")
-        assert p._extract_status(it) == PROGRESS_LABELS["preparing_answer"]
+        assert progress._extract_status(it) == PROGRESS_LABELS["preparing_answer"]
 
-    def test_final_var_in_response(self):
+    def test_final_var_in_response(self, progress):
         """FINAL_VAR(...) also triggers preparing answer."""
-        p = self._make_progress()
         it = _make_iteration(response="Done.\nFINAL_VAR(result)")
-        assert p._extract_status(it) == PROGRESS_LABELS["preparing_answer"]
+        assert progress._extract_status(it) == PROGRESS_LABELS["preparing_answer"]
 
-    def test_incidental_final_word_does_not_trigger(self):
+    def test_incidental_final_word_does_not_trigger(self, progress):
         """The word FINAL in prose should NOT trigger 'Preparing answer'."""
-        p = self._make_progress()
         it = _make_iteration(
             response="The FINAL step is to analyze the data.",
             code="x = 1",
         )
-        assert p._extract_status(it) != PROGRESS_LABELS["preparing_answer"]
+        assert progress._extract_status(it) != PROGRESS_LABELS["preparing_answer"]
 
-    def test_stdout_line_preferred(self):
+    def test_stdout_line_preferred(self, progress):
         """A meaningful stdout line is used as status."""
-        p = self._make_progress()
         it = _make_iteration(
             code="print('hello')",
             stdout="Found 12 relevant excerpts",
         )
-        assert p._extract_status(it) == "Found 12 relevant excerpts"
+        assert progress._extract_status(it) == "Found 12 relevant excerpts"
 
-    def test_stdout_noise_filtered(self):
+    def test_stdout_noise_filtered(self, progress):
         """Blank lines, JSON dumps, and tracebacks are skipped."""
-        p = self._make_progress()
         it = _make_iteration(
             code="x = 1",
             stdout='  \n{"key": "val"}\n[1,2,3]\nTraceback (most recent call):\nhi',
         )
         # Only "hi" should be too short (2 chars) — but wait, it's < 5 chars
         # So nothing qualifies → falls through to code inference
-        assert p._extract_status(it) != '{"key": "val"}'
+        assert progress._extract_status(it) != '{"key": "val"}'
 
-    def test_stdout_takes_last_meaningful_line(self):
-        p = self._make_progress()
+    def test_stdout_takes_last_meaningful_line(self, progress):
         it = _make_iteration(
             code="print stuff",
             stdout="First line of output\nSecond line of output\nThird line wins",
         )
-        assert p._extract_status(it) == "Third line wins"
+        assert progress._extract_status(it) == "Third line wins"
 
-    def test_sub_llm_calls_counted(self):
+    def test_sub_llm_calls_counted(self, progress):
         """When code blocks have rlm_calls, status reports the count."""
-        p = self._make_progress()
         it = _make_iteration(
             code="llm_query_batched(prompts)",
-            rlm_calls=[_make_rlm_call(), _make_rlm_call(), _make_rlm_call()],
+            rlm_calls=[_ONE_CALL] * 3,
         )
-        assert p._extract_status(it) == PROGRESS_LABELS["analyzing_excerpts"].format(n=3, s="s")
+        assert progress._extract_status(it) == _EXPECTED_ANALYZE_3
 
-    def test_single_sub_llm_call_no_plural(self):
-        p = self._make_progress()
+    def test_single_sub_llm_call_no_plural(self, progress):
         it = _make_iteration(
             code="llm_query(prompt)",
-            rlm_calls=[_make_rlm_call()],
-        )
-        assert p._extract_status(it) == PROGRESS_LABELS["analyzing_excerpts"].format(n=1, s="")
-
-    def test_code_inference_transcript_open(self):
-        p = self._make_progress()
-        it = _make_iteration(
-            code='with open(f"{transcript_dir}/{slug}/transcript.md") as f:',
+            rlm_calls=[_ONE_CALL],
         )
-        assert p._extract_status(it) == PROGRESS_LABELS["reading_transcripts"]
-
-    def test_code_inference_llm_query_batched(self):
-        p = self._make_progress()
-        it = _make_iteration(code="results = llm_query_batched(prompts)")
-        assert p._extract_status(it) == PROGRESS_LABELS["analyzing_parallel"]
-
-    def test_code_inference_llm_query(self):
-        p = self._make_progress()
-        it = _make_iteration(code="answer = llm_query(prompt)")
-        assert p._extract_status(it) == PROGRESS_LABELS["analyzing_ai"]
-
-    def test_code_inference_regex_search(self):
-        p = self._make_progress()
-        it = _make_iteration(code="matches = re.search(r'pattern', text)")
-        assert p._extract_status(it) == PROGRESS_LABELS["searching_text"]
-
-    def test_code_inference_catalog_scan(self):
-        p = self._make_progress()
-        it = _make_iteration(code='episodes = context["catalog"]')
-        assert p._extract_status(it) == PROGRESS_LABELS["scanning_catalog"]
-
-    def test_fallback_thinking(self):
+        assert progress._extract_status(it) == _EXPECTED_ANALYZE_1
+
+    @pytest.mark.parametrize("it, label", [
+        (_make_iteration(code=code), label) for code, label in _CODE_INFERENCE_CASES
+    ], ids=[label for _, label in _CODE_INFERENCE_CASES])
+    def test_code_inference(self, progress, it, label):
+        assert progress._extract_status(it) == PROGRESS_LABELS[label]
+
+    def test_sub_llm_calls_outrank_earlier_code_hint(self, progress):
+        """A later block's sub-LLM calls win over an earlier block's code hint."""
+        hinted = _make_iteration(code='eps = context["catalog"]').code_blocks[0]
+        called = _make_iteration(
+            code="x = 1", rlm_calls=[_ONE_CALL] * 2,
+        ).code_blocks[0]
+        it = RLMIteration(prompt="test", response="", code_blocks=[hinted, called])
+        assert progress._extract_status(it) == _EXPECTED_ANALYZE_2
+
+    def test_fallback_thinking(self, progress, empty_iteration):
         """Empty iteration with no code blocks falls back to 'Thinking...'"""
-        p = self._make_progress()
-        it = RLMIteration(prompt="test", response="hmm", code_blocks=[])
-        assert p._extract_status(it) == PROGRESS_LABELS["thinking"]
+        assert progress._extract_status(empty_iteration) == PROGRESS_LABELS["thinking"]
 
 
 # ---------------------------------------------------------------------------
 # _best_stdout_line tests
 # ---------------------------------------------------------------------------
 
-class TestBestStdoutLine:
+# (noise, meaningful line) pairs; each noise line must be skipped whether
+# it comes before or after the line that should win
+_STDOUT_NOISE_CASES = [
+    pytest.param("hi\nok", "A longer useful line here", id="short"),
+    pytest.param("x" * 121, "Normal line here", id="long"),
+    pytest.param('{"key": "value"}', "Actual status", id="json"),
+    pytest.param("[1, 2, 3, 4]", "Real output here", id="list"),
+    pytest.param(
+        'Traceback (most recent call last):\n  File "foo.py"', "Good line",
+        id="traceback",
+    ),
+    pytest.param("<module 'os'>", "Useful output", id="repr"),
+    pytest.param("----------", "Status update", id="rule"),
+]
 
-    def _make_progress(self) -> ProgressDisplay:
-        return ProgressDisplay(MagicMock())
 
-    def test_empty_stdout(self):
-        p = self._make_progress()
+class TestBestStdoutLine:
+
+    def test_empty_stdout(self, progress):
         it = _make_iteration(code="x = 1", stdout="")
-        assert p._best_stdout_line(it) is None
-
-    def test_no_code_blocks(self):
-        p = self._make_progress()
-        it = RLMIteration(prompt="test", response="", code_blocks=[])
-        assert p._best_stdout_line(it) is None
-
-    def test_filters_short_lines(self):
-        p = self._make_progress()
-        it = _make_iteration(code="x", stdout="hi\nok\nA longer useful line here")
-        assert p._best_stdout_line(it) == "A longer useful line here"
-
-    def test_filters_long_lines(self):
-        p = self._make_progress()
-        long_line = "x" * 121
-        it = _make_iteration(code="x", stdout=f"{long_line}\nNormal line here")
-        assert p._best_stdout_line(it) == "Normal line here"
-
-    def test_filters_json_dumps(self):
-        p = self._make_progress()
-        it = _make_iteration(code="x", stdout='{"key": "value"}\nActual status')
-        assert p._best_stdout_line(it) == "Actual status"
-
-    def test_filters_list_dumps(self):
-        p = self._make_progress()
-        it = _make_iteration(code="x", stdout="[1, 2, 3, 4]\nReal output here")
-        assert p._best_stdout_line(it) == "Real output here"
-
-    def test_filters_tracebacks(self):
-        p = self._make_progress()
-        it = _make_iteration(
-            code="x",
-            stdout='Traceback (most recent call last):\n  File "foo.py"\nGood line',
-        )
-        assert p._best_stdout_line(it) == "Good line"
+        assert progress._best_stdout_line(it) is None
 
-    def test_filters_repr_output(self):
-        p = self._make_progress()
-        it = _make_iteration(code="x", stdout="<module 'os'>\nUseful output")
-        assert p._best_stdout_line(it) == "Useful output"
+    def test_no_code_blocks(self, progress, empty_iteration):
+        assert progress._best_stdout_line(empty_iteration) is None
 
-    def test_filters_horizontal_rules(self):
-        p = self._make_progress()
-        it = _make_iteration(code="x", stdout="----------\nStatus update")
-        assert p._best_stdout_line(it) == "Status update"
+    @pytest.mark.parametrize("noise, expected", _STDOUT_NOISE_CASES)
+    @pytest.mark.parametrize("noise_first", [True, False], ids=["before", "after"])
+    def test_filters_noise(self, progress, noise, expected, noise_first):
+        stdout = f"{noise}\n{expected}" if noise_first else f"{expected}\n{noise}"
+        it = _make_iteration(code="x", stdout=stdout)
+        assert progress._best_stdout_line(it) == expected
 
 
 # ---------------------------------------------------------------------------
@@ -246,58 +255,45 @@ class TestBestStdoutLine:
 
 class TestLogLifecycle:
 
-    def _make_progress(self) -> ProgressDisplay:
-        p = ProgressDisplay(MagicMock(), initial_status="Starting...")
-        p._start_time = time.time()
-        return p
-
-    def test_first_log_moves_initial_to_completed(self):
-        p = self._make_progress()
+    def test_first_log_moves_initial_to_completed(self, fresh_progress):
         it = _make_iteration(code="x", stdout="Found 5 episodes")
-        p.log(it)
+        fresh_progress.log(it)
 
-        assert p._iteration_count == 1
-        assert p._completed_steps == ["Starting"]
-        assert p._current_status == "Found 5 episodes"
+        assert fresh_progress._iteration_count == 1
+        assert list(fresh_progress._completed_steps) == ["Starting"]
+        assert fresh_progress._current_status == "Found 5 episodes"
 
-    def test_duplicate_status_not_pushed(self):
+    def test_duplicate_status_not_pushed(self, fresh_progress):
         """If new status == current, don't push a completed step."""
-        p = self._make_progress()
-        p._current_status = PROGRESS_LABELS["reading_transcripts"]
+        fresh_progress._current_status = PROGRESS_LABELS["reading_transcripts"]
 
         it = _make_iteration(
             code='open(f"{transcript_dir}/slug/transcript.md")',
         )
         # This will infer the same reading_transcripts label — same as current
-        p.log(it)
-        assert PROGRESS_LABELS["reading_transcripts"].rstrip(".") not in p._completed_steps
+        fresh_progress.log(it)
+        assert PROGRESS_LABELS["reading_transcripts"].rstrip(".") not in fresh_progress._completed_steps
 
-    def test_completed_steps_cap(self):
-        """Internal list is capped to avoid unbounded growth."""
-        p = self._make_progress()
+    def test_completed_steps_cap(self, fresh_progress):
+        """Completed steps are capped to the visible window."""
         # Push many unique statuses
-        for i in range(20):
-            it = _make_iteration(
-                code="x",
-                stdout=f"Status message number {i:02d} here",
-            )
-            p.log(it)
-
-        # Internal list should be capped (not 20 items)
-        assert len(p._completed_steps) <= 8  # _MAX_COMPLETED * 2
-
-    def test_iteration_count_increments(self):
-        p = self._make_progress()
+        for it in _CAP_ITERATIONS:
+            fresh_progress.log(it)
+
+        # Internal deque keeps only the visible steps (not 20 items)
+        assert len(fresh_progress._completed_steps) == _MAX_COMPLETED
+        assert fresh_progress._completed_steps[-1] == "Status message number 18 here"
+
+    def test_iteration_count_increments(self, fresh_progress):
         for _ in range(5):
-            p.log(_make_iteration(code="x", stdout="Something useful"))
-        assert p._iteration_count == 5
+            fresh_progress.log(_make_iteration(code="x", stdout="Something useful"))
+        assert fresh_progress._iteration_count == 5
 
-    def test_log_metadata_is_noop(self):
+    def test_log_metadata_is_noop(self, fresh_progress):
         """log_metadata should not raise or change state."""
-        p = self._make_progress()
-        metadata = MagicMock(spec=RLMMetadata)
-        p.log_metadata(metadata)
-        assert p._iteration_count == 0
+        metadata = object.__new__(RLMMetadata)  # never read, so skip __init__
+        fresh_progress.log_metadata(metadata)
+        assert fresh_progress._iteration_count == 0
 
 
 # ---------------------------------------------------------------------------
@@ -306,28 +302,30 @@ class TestLogLifecycle:
 
 class TestContextManager:
 
+    @pytest.fixture(autouse=True)
+    def _patch_live(self, monkeypatch):
+        """Stub Live's enter/exit so no refresh thread is started."""
+        monkeypatch.setattr(Live, "__enter__", lambda self: self)
+        monkeypatch.setattr(Live, "__exit__", lambda self, *args: None)
+
     def test_enter_resets_state(self):
         console = MagicMock()
         p = ProgressDisplay(console, initial_status="Test...")
         p._iteration_count = 5
-        p._completed_steps = ["old step"]
+        p._completed_steps.append("old step")
 
-        with patch.object(Live, "__enter__", return_value=MagicMock()):
-            with patch.object(Live, "__exit__", return_value=None):
-                with p:
-                    assert p._iteration_count == 0
-                    assert p._completed_steps == []
-                    assert p._start_time is not None
-                    assert p._live is not None
+        with p:
+            assert p._iteration_count == 0
+            assert not p._completed_steps
+            assert p._start_time is not None
+            assert p._live is not None
 
     def test_exit_clears_live(self):
         console = MagicMock()
         p = ProgressDisplay(console)
 
-        with patch.object(Live, "__enter__", return_value=MagicMock()):
-            with patch.object(Live, "__exit__", return_value=None):
-                with p:
-                    pass
+        with p:
+            pass
 
         assert p._live is None
 
@@ -353,23 +351,16 @@ class TestTruncate:
 
 class TestInferFromCode:
 
-    def test_transcript_open(self):
-        assert _infer_from_code('open(f"{td}/transcript.md")') == PROGRESS_LABELS["reading_transcripts"]
-
-    def test_llm_query_batched(self):
-        assert _infer_from_code("llm_query_batched(prompts)") == PROGRESS_LABELS["analyzing_parallel"]
-
-    def test_llm_query(self):
-        assert _infer_from_code("answer = llm_query(p)") == PROGRESS_LABELS["analyzing_ai"]
-
-    def test_regex_search(self):
-        assert _infer_from_code("re.search(r'pat', text)") == PROGRESS_LABELS["searching_text"]
-
-    def test_regex_findall(self):
-        assert _infer_from_code("re.findall(r'pat', text)") == PROGRESS_LABELS["searching_text"]
-
-    def test_catalog_access(self):
-        assert _infer_from_code('eps = context["catalog"]') == PROGRESS_LABELS["scanning_catalog"]
+    @pytest.mark.parametrize("code, label", [
+        ('open(f"{td}/transcript.md")', "reading_transcripts"),
+        ("llm_query_batched(prompts)", "analyzing_parallel"),
+        ("answer = llm_query(p)", "analyzing_ai"),
+        ("re.search(r'pat', text)", "searching_text"),
+        ("re.findall(r'pat', text)", "searching_text"),
+        ('eps = context["catalog"]', "scanning_catalog"),
+    ])
+    def test_infers_label(self, code, label):
+        assert _infer_from_code(code) == PROGRESS_LABELS[label]
 
     def test_unknown_code_returns_none(self):
         assert _infer_from_code("x = 1 + 2") is None
@@ -382,18 +373,20 @@ class TestInferFromCode:
 class TestElapsed:
 
     def test_no_start_time(self):
-        p = ProgressDisplay(MagicMock())
+        p = ProgressDisplay(_StubConsole())
         assert p._elapsed() == "0:00"
 
-    def test_seconds_only(self):
-        p = ProgressDisplay(MagicMock())
-        p._start_time = time.time() - 45
+    def test_seconds_only(self, monkeypatch):
+        monkeypatch.setattr("lenny.progress.time.monotonic", lambda: 1000.0)
+        p = ProgressDisplay(_StubConsole())
+        p._start_time = 955.0
         elapsed = p._elapsed()
         assert elapsed == "0:45"
 
-    def test_minutes_and_seconds(self):
-        p = ProgressDisplay(MagicMock())
-        p._start_time = time.time() - 155
+    def test_minutes_and_seconds(self, monkeypatch):
+        monkeypatch.setattr("lenny.progress.time.monotonic", lambda: 1000.0)
+        p = ProgressDisplay(_StubConsole())
+        p._start_time = 845.0
         elapsed = p._elapsed()
         assert elapsed == "2:35"
 
@@ -402,37 +395,42 @@ class TestElapsed:
 # Theme plumbing
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="session")
+def line_theme():
+    """Warm palette with a non-default spinner, built once per session."""
+    from lenny.style import LennyTheme, THEME_WARM
+    return LennyTheme(
+        name="test",
+        accent=THEME_WARM.accent,
+        text=THEME_WARM.text,
+        text_dim=THEME_WARM.text_dim,
+        text_faint=THEME_WARM.text_faint,
+        fast=THEME_WARM.fast,
+        research=THEME_WARM.research,
+        success=THEME_WARM.success,
+        error=THEME_WARM.error,
+        warning=THEME_WARM.warning,
+        prompt=THEME_WARM.prompt,
+        border_fast=THEME_WARM.border_fast,
+        border_research=THEME_WARM.border_research,
+        spinner_style="line",  # different from default "dots"
+    )
+
+
 class TestThemePlumbing:
 
-    def test_spinner_uses_theme_style(self):
-        from lenny.style import LennyTheme, THEME_WARM
-        mock_theme = LennyTheme(
-            name="test",
-            accent=THEME_WARM.accent,
-            text=THEME_WARM.text,
-            text_dim=THEME_WARM.text_dim,
-            text_faint=THEME_WARM.text_faint,
-            fast=THEME_WARM.fast,
-            research=THEME_WARM.research,
-            success=THEME_WARM.success,
-            error=THEME_WARM.error,
-            warning=THEME_WARM.warning,
-            prompt=THEME_WARM.prompt,
-            border_fast=THEME_WARM.border_fast,
-            border_research=THEME_WARM.border_research,
-            spinner_style="line",  # different from default "dots"
-        )
-        p = ProgressDisplay(MagicMock(), initial_status="Test...", theme=mock_theme)
+    def test_spinner_uses_theme_style(self, line_theme):
+        p = ProgressDisplay(_StubConsole(), initial_status="Test...", theme=line_theme)
         p._current_status = "Working..."
-        p._start_time = time.time()
+        p._start_time = time.monotonic()
         renderable = p._build_renderable()
         # The renderable is a Group; we can't easily inspect Spinner internals,
         # but at minimum this should not raise and should produce output
         assert renderable is not None
 
     def test_spinner_defaults_to_dots_without_theme(self):
-        p = ProgressDisplay(MagicMock(), initial_status="Test...")
+        p = ProgressDisplay(_StubConsole(), initial_status="Test...")
         p._current_status = "Working..."
-        p._start_time = time.time()
+        p._start_time = time.monotonic()
         renderable = p._build_renderable()
         assert renderable is not None
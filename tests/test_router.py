@@ -23,6 +23,12 @@ class _FakeClient:
         self.messages = _FakeMessages(response_text)
 
 
+# _FakeMessages.create is stateless, so the judge stubs are shared
+_FAKE_FAST = _FakeClient("FAST")
+_FAKE_UNSURE = _FakeClient("UNSURE")
+_FAKE_RESEARCH_DOT = _FakeClient("RESEARCH.")
+
+
 # ---------------------------------------------------------------------------
 # Deterministic guardrails
 # ---------------------------------------------------------------------------
@@ -80,22 +86,19 @@ def test_ambiguous_without_client_defaults_research():
 
 
 def test_ambiguous_with_llm_judge_fast():
-    client = _FakeClient("FAST")
-    decision = classify_query("brian chesky founder mode details", [], client=client)
+    decision = classify_query("brian chesky founder mode details", [], client=_FAKE_FAST)
     assert decision.mode == QueryMode.FAST
     assert "llm-judge" in decision.reason
 
 
 def test_ambiguous_with_unparseable_llm_judge_defaults_research():
-    client = _FakeClient("UNSURE")
-    decision = classify_query("brian chesky founder mode details", [], client=client)
+    decision = classify_query("brian chesky founder mode details", [], client=_FAKE_UNSURE)
     assert decision.mode == QueryMode.RESEARCH
     assert "default research" in decision.reason
 
 
 def test_judge_noisy_response_still_parses():
     """Judge returns 'RESEARCH.' with trailing punctuation — should still parse."""
-    client = _FakeClient("RESEARCH.")
-    decision = classify_query("brian chesky founder mode details", [], client=client)
+    decision = classify_query("brian chesky founder mode details", [], client=_FAKE_RESEARCH_DOT)
     assert decision.mode == QueryMode.RESEARCH
     assert "llm-judge" in decision.reason
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import dataclasses
+import io
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -16,13 +18,17 @@ from lenny.style import (
     LennyTheme,
     build_splash_art,
     build_splash_card,
+    HELP_TEXT,
     detect_color_depth,
     format_cost_compact,
     format_route_badge,
     format_save_confirmation,
     answer_panel_params,
+    analyzing_excerpts_label,
     is_wide_terminal,
+    render_help,
     _pick_daily_prompt,
+    _BRAND_MARK_WIDTH,
     PROGRESS_LABELS,
 )
 
@@ -116,13 +122,19 @@ class TestBuildSplashArt:
         result = build_splash_art(THEME_MINIMAL, console)
         assert result is None
 
-    def test_art_width_boundary_100(self):
-        console = self._make_console(100)
+    def test_art_width_matches_widest_line(self):
+        widest = max(len(line) for line in build_splash_art(
+            THEME_WARM, self._make_console(120),
+        ).plain.splitlines())
+        assert _BRAND_MARK_WIDTH == widest
+
+    def test_art_width_boundary_exact(self):
+        console = self._make_console(_BRAND_MARK_WIDTH)
         result = build_splash_art(THEME_WARM, console)
         assert result is not None
 
-    def test_art_width_boundary_99(self):
-        console = self._make_console(99)
+    def test_art_width_boundary_one_short(self):
+        console = self._make_console(_BRAND_MARK_WIDTH - 1)
         result = build_splash_art(THEME_WARM, console)
         assert result is None
 
@@ -238,6 +250,16 @@ class TestAnswerPanelParams:
         assert params["border_style"] == THEME_WARM.border_research
         assert "research" in params["title"]
 
+    def test_params_are_prebuilt_and_read_only(self):
+        params = answer_panel_params("fast", THEME_WARM)
+        assert params is answer_panel_params("fast", THEME_WARM)
+        with pytest.raises(TypeError):
+            params["title"] = "changed"
+
+    def test_unknown_mode_falls_back_to_research(self):
+        params = answer_panel_params("other", THEME_MINIMAL)
+        assert params["border_style"] == THEME_MINIMAL.border_research
+
 
 # ---------------------------------------------------------------------------
 # Cost and save helpers
@@ -257,6 +279,28 @@ class TestFormatHelpers:
         assert "\u2713" in result.plain  # checkmark
 
 
+# ---------------------------------------------------------------------------
+# Help text
+# ---------------------------------------------------------------------------
+
+class TestRenderHelp:
+
+    def _render(self, renderable, theme: LennyTheme) -> str:
+        console = Console(
+            width=100, force_terminal=True, color_system="truecolor",
+            file=io.StringIO(), theme=theme.to_rich_theme(),
+        )
+        console.print(renderable)
+        return console.file.getvalue()
+
+    def test_parsed_once(self):
+        assert render_help() is render_help()
+
+    @pytest.mark.parametrize("theme", [THEME_WARM, THEME_MINIMAL])
+    def test_matches_printing_markup(self, theme):
+        assert self._render(render_help(), theme) == self._render(HELP_TEXT, theme)
+
+
 # ---------------------------------------------------------------------------
 # Theme definitions
 # ---------------------------------------------------------------------------
@@ -275,6 +319,15 @@ class TestThemes:
         theme = THEME_MINIMAL.to_rich_theme()
         assert isinstance(theme, Theme)
 
+    def test_to_rich_theme_is_memoized(self):
+        assert THEME_WARM.to_rich_theme() is THEME_WARM.to_rich_theme()
+        assert THEME_WARM.to_rich_theme() is not THEME_MINIMAL.to_rich_theme()
+
+    def test_themes_are_frozen(self):
+        """Cached derived values rely on themes never being mutated."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            THEME_WARM.accent = "red"
+
     def test_warm_shows_art(self):
         assert THEME_WARM.show_splash_art is True
 
@@ -303,6 +356,11 @@ class TestProgressLabels:
         assert "3" in result
         assert "excerpts" in result
 
+    @pytest.mark.parametrize("n, s", [(0, "s"), (1, ""), (2, "s"), (12, "s")])
+    def test_analyzing_excerpts_label_matches_template(self, n, s):
+        expected = PROGRESS_LABELS["analyzing_excerpts"].format(n=n, s=s)
+        assert analyzing_excerpts_label(n) == expected
+
     def test_searching_episodes_is_formattable(self):
         result = PROGRESS_LABELS["searching_episodes"].format(n=152)
         assert "152" in result